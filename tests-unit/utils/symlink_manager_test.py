@@ -0,0 +1,233 @@
+import json
+import os
+import stat
+
+import pytest
+
+from utils.symlink_manager import SymlinkManager, _entry_type
+
+
+@pytest.fixture
+def share_dir(tmp_path):
+    share = tmp_path / "share"
+    (share / "models" / "checkpoints").mkdir(parents=True)
+    (share / "models" / "checkpoints" / "model.safetensors").write_text("weights")
+    (share / "models" / "loras").mkdir()
+    (share / "models" / "loras" / "lora.safetensors").write_text("lora")
+    (share / "input").mkdir()
+    (share / "input" / "image.png").write_text("png")
+    return share
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    project = tmp_path / "ComfyUI"
+    project.mkdir()
+    return project
+
+
+def test_create_symlinks_links_files(share_dir, project_dir):
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    manager.create_symlinks()
+
+    link = project_dir / "models" / "checkpoints" / "model.safetensors"
+    assert link.is_symlink()
+    assert os.readlink(link) == str(share_dir / "models" / "checkpoints" / "model.safetensors")
+    assert (project_dir / "models" / "loras" / "lora.safetensors").is_symlink()
+    assert (project_dir / "input" / "image.png").is_symlink()
+    assert not (project_dir / "models").is_symlink()
+
+
+def test_create_symlinks_keeps_existing_files(share_dir, project_dir):
+    local = project_dir / "models" / "checkpoints" / "model.safetensors"
+    local.parent.mkdir(parents=True)
+    local.write_text("local")
+
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    manager.create_symlinks()
+
+    assert not local.is_symlink()
+    assert local.read_text() == "local"
+    assert (project_dir / "models" / "loras" / "lora.safetensors").is_symlink()
+
+
+def test_create_symlinks_is_idempotent(share_dir, project_dir):
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    manager.create_symlinks()
+    manager.create_symlinks()
+
+    assert (project_dir / "input" / "image.png").is_symlink()
+
+
+def test_create_symlinks_skips_unchanged_directories(share_dir, project_dir):
+    os.utime(share_dir / "input", ns=(1, 1))
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    assert (project_dir / ".symlink_manifest.json").exists()
+
+    # Removing a link changes the project directory mtime and the link is restored
+    os.utime(project_dir / "input", ns=(1, 1))
+    (project_dir / "input" / "image.png").unlink()
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    assert (project_dir / "input" / "image.png").is_symlink()
+
+    # Adding an entry changes the share directory mtime and triggers a rescan
+    (share_dir / "input" / "other.png").write_text("png")
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    assert (project_dir / "input" / "other.png").is_symlink()
+
+
+def test_create_symlinks_skips_directories_unchanged_on_both_sides(share_dir, project_dir):
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+
+    # Age both sides so the directory is no longer racily clean and gets recorded
+    os.utime(share_dir / "input", ns=(1, 1))
+    os.utime(project_dir / "input", ns=(1, 1))
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+
+    # Add a share file but keep the share directory mtime, so the directory looks unchanged
+    (share_dir / "input" / "hidden.png").write_text("png")
+    os.utime(share_dir / "input", ns=(1, 1))
+
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    assert not os.path.lexists(project_dir / "input" / "hidden.png")
+
+
+def test_create_symlinks_does_not_record_racily_clean_directories(share_dir, project_dir):
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+
+    # A change in the same timestamp tick as the sync leaves the mtime unchanged
+    mtime = os.stat(share_dir / "input").st_mtime_ns
+    (share_dir / "input" / "late.png").write_text("png")
+    os.utime(share_dir / "input", ns=(mtime, mtime))
+
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    assert (project_dir / "input" / "late.png").is_symlink()
+
+
+def test_create_symlinks_retries_dangling_share_links(share_dir, project_dir, tmp_path):
+    checkpoints = share_dir / "models" / "checkpoints"
+    (checkpoints / "pending.safetensors").symlink_to(tmp_path / "ext")
+    os.utime(checkpoints, ns=(1, 1), follow_symlinks=False)
+
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    os.utime(project_dir / "models" / "checkpoints", ns=(1, 1))
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    assert not os.path.lexists(project_dir / "models" / "checkpoints" / "pending.safetensors")
+
+    # The link target appears without the share directory changing
+    (tmp_path / "ext").write_text("weights")
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+    assert (project_dir / "models" / "checkpoints" / "pending.safetensors").is_symlink()
+
+
+def test_create_symlinks_ignores_malformed_manifest_entries(share_dir, project_dir):
+    with open(project_dir / ".symlink_manifest.json", "w") as f:
+        json.dump({str(share_dir / "input"): [], str(share_dir / "models"): [1, 2, [3]]}, f)
+
+    SymlinkManager(str(project_dir), str(share_dir)).create_symlinks()
+
+    assert (project_dir / "input" / "image.png").is_symlink()
+    assert (project_dir / "models" / "checkpoints" / "model.safetensors").is_symlink()
+
+
+def test_create_symlinks_missing_share(tmp_path, project_dir):
+    manager = SymlinkManager(str(project_dir), str(tmp_path / "missing"))
+    manager.create_symlinks()
+
+    assert list(project_dir.iterdir()) == []
+
+
+def test_create_symlinks_follows_symlinks_in_share(share_dir, project_dir, tmp_path):
+    blob = tmp_path / "blob"
+    blob.write_text("blob")
+    (share_dir / "models" / "checkpoints" / "linked.safetensors").symlink_to(blob)
+    (share_dir / "models" / "checkpoints" / "broken.safetensors").symlink_to(tmp_path / "missing")
+
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    manager.create_symlinks()
+
+    assert (project_dir / "models" / "checkpoints" / "linked.safetensors").read_text() == "blob"
+    assert not os.path.lexists(project_dir / "models" / "checkpoints" / "broken.safetensors")
+
+
+def test_entry_type(share_dir, tmp_path):
+    (share_dir / "link_to_dir").symlink_to(share_dir / "models")
+    (share_dir / "broken").symlink_to(tmp_path / "missing")
+
+    with os.scandir(share_dir) as it:
+        types = {entry.name: _entry_type(entry) for entry in it}
+    with os.scandir(share_dir / "input") as it:
+        types.update({entry.name: _entry_type(entry) for entry in it})
+
+    assert types["models"] == stat.S_IFDIR
+    assert types["link_to_dir"] == stat.S_IFDIR
+    assert types["image.png"] == stat.S_IFREG
+    assert types["broken"] == 0
+
+
+def test_list_and_remove_symlinks(share_dir, project_dir):
+    (project_dir / "input").symlink_to(share_dir / "input")
+
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    assert manager.list_symlinks() == ["input"]
+
+    info = manager.get_symlink_info()
+    assert info["symlinks"]["input"]["source"] == str(share_dir / "input")
+    assert info["symlinks"]["input"]["exists"]
+
+    manager.remove_symlinks()
+    assert manager.list_symlinks() == []
+    assert (share_dir / "input" / "image.png").exists()
+
+
+def test_symlink_info_with_stale_cache(share_dir, project_dir):
+    (project_dir / "input").symlink_to(share_dir / "input")
+
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    assert manager.list_symlinks() == ["input"]
+
+    (project_dir / "input").unlink()
+    (project_dir / "input").mkdir()
+
+    info = manager.get_symlink_info()
+    assert "input" not in info["symlinks"]
+    assert info["existing_directories"]["input"] == str(project_dir / "input")
+
+
+def test_remove_symlinks_does_not_trust_stale_cache(share_dir, project_dir):
+    (project_dir / "input").symlink_to(share_dir / "input")
+
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    assert manager.list_symlinks() == ["input"]
+
+    (project_dir / "input").unlink()
+    (project_dir / "input").write_text("user data")
+
+    manager.remove_symlinks()
+    assert (project_dir / "input").read_text() == "user data"
+
+
+def test_symlink_metadata_is_cached_until_invalidated(share_dir, project_dir):
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    assert manager.list_symlinks() == []
+
+    (project_dir / "input").symlink_to(share_dir / "input")
+    assert manager.list_symlinks() == []
+
+    manager.invalidate()
+    assert manager.list_symlinks() == ["input"]
+
+
+def test_missing_share_directory_is_cached_until_refresh(share_dir, project_dir):
+    manager = SymlinkManager(str(project_dir), str(share_dir))
+    manager.create_symlinks()
+    assert not (project_dir / "user").exists()
+
+    (share_dir / "user").mkdir()
+    (share_dir / "user" / "settings.json").write_text("{}")
+    manager.create_symlinks()
+    assert not (project_dir / "user").exists()
+
+    manager.refresh()
+    manager.create_symlinks()
+    assert (project_dir / "user" / "settings.json").is_symlink()
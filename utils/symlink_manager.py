@@ -1,12 +1,137 @@
 """
 Symlink Manager for ComfyUI
 Creates symbolic links from /share/ directory to ComfyUI project directories
+
+This module is fully type-annotated so it can optionally be compiled with mypyc;
+the compiled extension is picked up automatically when present, otherwise this
+pure-Python module is used
 """
 
 import os
+import sys
+import stat
+import json
+import time
 import logging
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+# statx(2) constants from <linux/fcntl.h> and <linux/stat.h>
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x1
+
+# Directories modified within this window of a sync are not recorded in the manifest:
+# a change in the same timestamp tick would leave the mtime unchanged, so the entry
+# could never be told apart from the synced state (2s covers the coarsest common
+# granularity, used by FAT and some network filesystems)
+_RACY_MTIME_NS = 2 * 10**9
+
+# struct statx is 256 bytes; stx_mode is the __u16 at byte offset 28
+_STATX_SIZE = 256
+_STX_MODE_OFFSET = 28
+
+
+@functools.cache
+def _load_statx() -> Optional[Any]:
+    """
+    Load statx from libc on Linux, once per process
+    
+    Returns:
+        The statx function, or None if statx is unavailable
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    
+    try:
+        import ctypes
+        
+        statx = ctypes.CDLL(None, use_errno=True).statx
+        statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_char_p]
+        statx.restype = ctypes.c_int
+        
+        # glibc may export statx on a kernel older than 4.11 that lacks the syscall
+        if statx(_AT_FDCWD, b"/", _AT_STATX_DONT_SYNC, _STATX_TYPE, ctypes.create_string_buffer(_STATX_SIZE)) != 0:
+            return None
+    except (ImportError, OSError, AttributeError):
+        return None
+    
+    return statx
+
+
+def _statx_type(path: str) -> Optional[int]:
+    """
+    Get the file type of a path, following symlinks, using statx with STATX_TYPE only
+    AT_STATX_DONT_SYNC lets network filesystems answer from cache instead of revalidating
+    
+    Args:
+        path: Path to query
+        
+    Returns:
+        The stat.S_IFMT file type, or None if statx is unavailable or failed
+    """
+    statx = _load_statx()
+    if statx is None:
+        return None
+    
+    import ctypes
+    
+    buf = ctypes.create_string_buffer(_STATX_SIZE)
+    if statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _STATX_TYPE, buf) != 0:
+        return None
+    mode = int.from_bytes(buf.raw[_STX_MODE_OFFSET:_STX_MODE_OFFSET + 2], sys.byteorder)
+    return stat.S_IFMT(mode)
+
+
+def _is_manifest_entry(entry: Any) -> bool:
+    """
+    Check that a manifest entry loaded from JSON has the expected shape
+    
+    Args:
+        entry: Value loaded from the manifest
+        
+    Returns:
+        True if entry is [share mtime_ns, project mtime_ns, list of subdirectory names]
+    """
+    return (
+        isinstance(entry, list)
+        and len(entry) == 3
+        and all(isinstance(mtime, int) and not isinstance(mtime, bool) for mtime in entry[:2])
+        and isinstance(entry[2], list)
+        and all(isinstance(name, str) for name in entry[2])
+    )
+
+
+def _entry_type(entry: "os.DirEntry[str]") -> int:
+    """
+    Get the file type of a directory entry, following symlinks
+    Regular entries are answered from the d_type cached by scandir; only symlinks
+    need a stat of their target, which is done with statx when available
+    
+    Args:
+        entry: Directory entry from os.scandir
+        
+    Returns:
+        stat.S_IFREG, stat.S_IFDIR, another stat.S_IFMT type, or 0 for broken links
+    """
+    if not entry.is_symlink():
+        if entry.is_dir(follow_symlinks=False):
+            return stat.S_IFDIR
+        if entry.is_file(follow_symlinks=False):
+            return stat.S_IFREG
+        return 0
+    
+    file_type = _statx_type(entry.path)
+    if file_type is None:
+        try:
+            file_type = stat.S_IFMT(entry.stat().st_mode)
+        except OSError:
+            return 0
+    return file_type
 
 
 class SymlinkManager:
@@ -22,16 +147,29 @@ class SymlinkManager:
         """
         self.project_root = Path(project_root).resolve()
         self.share_directory = Path(share_directory).resolve()
+        self._project_root_str = str(self.project_root)
         self.logger = logging.getLogger(__name__)
         
-        # Define the directories that should be linked from /share/
-        self.target_directories = {
-            "models",
-            "custom_nodes", 
+        # lstat results of the project target directories, filled lazily
+        self._meta_cache: Dict[str, Optional[os.stat_result]] = {}
+        
+        # Whether each target directory exists in the share directory, filled lazily
+        self._share_exists_cache: Dict[str, bool] = {}
+        
+        # Share directory -> [share mtime_ns, project mtime_ns, subdirectory names]
+        # as of the last completed sync
+        self._manifest: Dict[str, List[Any]] = {}
+        self._manifest_path = os.path.join(self._project_root_str, ".symlink_manifest.json")
+        
+        # Define the directories that should be linked from /share/, sorted so
+        # they are always processed in the same order
+        self.target_directories: Tuple[str, ...] = (
+            "custom_nodes",
             "input",
+            "models",
             "output",
             "user"
-        }
+        )
     
     def create_symlinks(self) -> None:
         """
@@ -47,20 +185,32 @@ class SymlinkManager:
         created_links = []
         created_directories = []
         skipped_items = []
-        
-        for target_dir in self.target_directories:
-            share_path = self.share_directory / target_dir
-            project_path = self.project_root / target_dir
-            
-            if not share_path.exists():
-                self.logger.debug(f"Source {share_path} does not exist in share directory")
-                skipped_items.append(target_dir)
-                continue
+        manifest = {}
+        self._manifest = self._load_manifest()
+        
+        # Each target directory is an independent subtree and the work is syscall
+        # bound, so sync them concurrently
+        with ThreadPoolExecutor(max_workers=len(self.target_directories)) as executor:
+            futures = []
+            for target_dir in self.target_directories:
+                share_path = self.share_directory / target_dir
+                project_path = self.project_root / target_dir
+                
+                if not self._share_exists(target_dir):
+                    self.logger.debug(f"Source {share_path} does not exist in share directory")
+                    skipped_items.append(target_dir)
+                    continue
+                
+                # Sync the directory structure
+                futures.append(executor.submit(self._sync_directory_recursive, str(share_path), str(project_path)))
             
-            # Recursively sync the directory structure
-            sync_result = self._sync_directory_recursive(share_path, project_path)
-            created_links.extend(sync_result['links'])
-            created_directories.extend(sync_result['directories'])
+            for future in futures:
+                sync_result = future.result()
+                created_links.extend(sync_result['links'])
+                created_directories.extend(sync_result['directories'])
+                manifest.update(sync_result['manifest'])
+        
+        self._save_manifest(manifest)
         
         if created_directories:
             self.logger.info(f"Successfully created directories: {', '.join(created_directories)}")
@@ -70,97 +220,249 @@ class SymlinkManager:
         
         if skipped_items:
             self.logger.info(f"Skipped items (not found in share): {', '.join(skipped_items)}")
+        
+        self.invalidate()
+    
+    def _load_manifest(self) -> Dict[str, List[Any]]:
+        """
+        Load the manifest of share directories written by the last sync
+        
+        Returns:
+            The manifest, or an empty dictionary if it is missing or unreadable
+        """
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(manifest, dict):
+            return {}
+        
+        # Malformed entries are dropped, so those directories are simply rescanned
+        return {
+            share_dir: entry for share_dir, entry in manifest.items()
+            if _is_manifest_entry(entry)
+        }
+    
+    def _save_manifest(self, manifest: Dict[str, List[Any]]) -> None:
+        """
+        Save the manifest of synced share directories for the next sync
+        
+        Args:
+            manifest: Share directory -> [share mtime_ns, project mtime_ns, subdirectory names]
+        """
+        tmp_path = f"{self._manifest_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self._manifest_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to save symlink manifest {self._manifest_path}: {e}")
+    
+    def invalidate(self) -> None:
+        """
+        Drop cached file type information about the project target directories
+        Must be called after anything modifies the project directories
+        """
+        self._meta_cache.clear()
     
-    def _should_create_symlink(self, share_path: Path, project_path: Path) -> bool:
+    def refresh(self) -> None:
+        """
+        Drop all cached file system state, including share directories found missing
+        Call this if the share directory is mounted or populated after the manager was created
         """
-        Check if a symlink should be created
+        self._share_exists_cache.clear()
+        self.invalidate()
+    
+    def _share_exists(self, target_dir: str) -> bool:
+        """
+        Check if a target directory exists in the share directory, cached per manager
         
         Args:
-            share_path: Path in /share/ directory
-            project_path: Target path in project directory
+            target_dir: Name of the target directory
             
         Returns:
-            True if symlink should be created, False otherwise
+            True if the share directory contains target_dir as a directory
         """
-        # Check if source exists in /share/
-        if not share_path.exists():
-            self.logger.debug(f"Source {share_path} does not exist in share directory")
-            return False
+        if target_dir not in self._share_exists_cache:
+            self._share_exists_cache[target_dir] = os.path.isdir(self.share_directory / target_dir)
+        return self._share_exists_cache[target_dir]
+    
+    def _get_lmeta(self, target_dir: str) -> Optional[os.stat_result]:
+        """
+        Get the lstat result of a project target directory, cached per manager
         
-        # Check if target already exists in project
-        if project_path.exists():
-            self.logger.debug(f"Target {project_path} already exists, skipping")
-            return False
+        Args:
+            target_dir: Name of the target directory
+            
+        Returns:
+            The lstat result, or None if the path does not exist
+        """
+        if target_dir not in self._meta_cache:
+            try:
+                self._meta_cache[target_dir] = os.lstat(os.path.join(self._project_root_str, target_dir))
+            except FileNotFoundError:
+                self._meta_cache[target_dir] = None
+        return self._meta_cache[target_dir]
+    
+    def _is_symlink(self, target_dir: str) -> bool:
+        """
+        Check if a project target directory is a symlink using the cached lstat
         
-        return True
+        Args:
+            target_dir: Name of the target directory
+            
+        Returns:
+            True if the project path is a symlink, False otherwise
+        """
+        st = self._get_lmeta(target_dir)
+        return st is not None and stat.S_ISLNK(st.st_mode)
     
-    def _sync_directory_recursive(self, share_path: Path, project_path: Path) -> dict:
+    def _sync_directory_recursive(self, share_path: str, project_path: str) -> Dict[str, Any]:
         """
-        Recursively sync directory structure from share to project
+        Sync directory structure from share to project, walking it breadth-first
         Creates directories and symlinks for all files that don't exist in project
         
+        Directories whose share and project mtimes both match the manifest from the
+        last sync had no entries added or removed on either side since, so they are
+        not listed again; only their subdirectories are visited.
+        
         Args:
             share_path: Source directory in /share/
             project_path: Target directory in project
             
         Returns:
-            Dictionary with 'links' and 'directories' lists
+            Dictionary with 'links' and 'directories' lists and the 'manifest' entries
+            of the directories that were synced completely
         """
-        result = {'links': [], 'directories': []}
-        
-        try:
-            # Ensure target directory exists
-            if not project_path.exists():
-                project_path.mkdir(parents=True, exist_ok=True)
-                result['directories'].append(str(project_path.relative_to(self.project_root)))
-                self.logger.debug(f"Created directory: {project_path}")
+        links: List[str] = []
+        directories: List[str] = []
+        manifest: Dict[str, List[Any]] = {}
+        completed: List[Tuple[str, str, int, List[str]]] = []
+        queue: Deque[Tuple[str, str]] = deque([(share_path, project_path)])
+        
+        while queue:
+            share_dir, project_dir = queue.popleft()
             
-            # Process all items in the share directory
-            for item in share_path.iterdir():
-                share_item = share_path / item.name
-                project_item = project_path / item.name
+            try:
+                # Ensure target directory exists; this is the parent of every link
+                # created below, so links never need to create their own parents
+                created = False
+                try:
+                    os.makedirs(project_dir)
+                    created = True
+                    directories.append(self._relative_path(project_dir))
+                    self.logger.debug("Created directory: %s", project_dir)
+                except FileExistsError:
+                    pass
                 
-                if item.is_file():
-                    # For files, create symlink if it doesn't exist
-                    if not project_item.exists():
-                        if self._create_symlink(share_item, project_item):
-                            result['links'].append(str(project_item.relative_to(self.project_root)))
-                            self.logger.debug(f"Created file symlink: {project_item} -> {share_item}")
-                    else:
-                        self.logger.debug(f"File {project_item} already exists, skipping")
+                # Read the mtime before listing so changes made during the scan
+                # are picked up by the next sync
+                mtime = os.stat(share_dir).st_mtime_ns
+                cached = self._manifest.get(share_dir)
+                if (not created and cached is not None and cached[0] == mtime
+                        and cached[1] == os.stat(project_dir).st_mtime_ns):
+                    manifest[share_dir] = cached
+                    for name in cached[2]:
+                        queue.append((os.path.join(share_dir, name), os.path.join(project_dir, name)))
+                    continue
+                
+                subdirs: List[str] = []
+                complete = True
+                
+                # Process all items in the share directory; DirEntry caches the file
+                # type from readdir so no extra stat is needed per entry
+                with os.scandir(share_dir) as it:
+                    for entry in it:
+                        share_item = entry.path
+                        project_item = os.path.join(project_dir, entry.name)
                         
-                elif item.is_dir():
-                    # For directories, recursively sync
-                    sub_result = self._sync_directory_recursive(share_item, project_item)
-                    result['links'].extend(sub_result['links'])
-                    result['directories'].extend(sub_result['directories'])
-                    
-        except Exception as e:
-            self.logger.error(f"Error syncing directory {share_path}: {e}")
+                        entry_type = _entry_type(entry)
+                        
+                        if entry_type == stat.S_IFREG:
+                            # For files, create symlink unless the target already exists
+                            try:
+                                if self._create_symlink(share_item, project_item):
+                                    links.append(self._relative_path(project_item))
+                                    self.logger.debug("Created file symlink: %s -> %s", project_item, share_item)
+                                else:
+                                    complete = False
+                            except FileExistsError:
+                                self.logger.debug("Target %s already exists, skipping", project_item)
+                        
+                        elif entry_type == stat.S_IFDIR:
+                            # For directories, sync them in a later iteration
+                            subdirs.append(entry.name)
+                            queue.append((share_item, project_item))
+                        
+                        elif entry.is_symlink():
+                            # A dangling link, e.g. to a share that is not mounted yet, can
+                            # start resolving without this directory's mtime changing
+                            complete = False
+                
+                # Only remember directories where every file is linked, so failures are retried
+                if complete:
+                    completed.append((share_dir, project_dir, mtime, subdirs))
+            
+            except Exception as e:
+                self.logger.error(f"Error syncing directory {share_dir}: {e}")
+        
+        # Project mtimes are read once the whole tree is synced, because creating a
+        # subdirectory later in the walk changes the mtime of its parent
+        now = time.time_ns()
+        for share_dir, project_dir, mtime, subdirs in completed:
+            try:
+                project_mtime = os.stat(project_dir).st_mtime_ns
+            except OSError:
+                continue
+            
+            # Racily clean: too recent to prove nothing changed after the listing
+            if now - mtime < _RACY_MTIME_NS or now - project_mtime < _RACY_MTIME_NS:
+                continue
+            
+            manifest[share_dir] = [mtime, project_mtime, subdirs]
+        
+        return {'links': links, 'directories': directories, 'manifest': manifest}
+    
+    def _relative_path(self, project_item: str) -> str:
+        """
+        Get the path of a project item relative to the project root
         
-        return result
+        Args:
+            project_item: Path inside the project directory
+            
+        Returns:
+            Relative path string
+        """
+        return project_item[len(self._project_root_str) + 1:]
     
-    def _create_symlink(self, source_path: Path, target_path: Path) -> bool:
+    def _create_symlink(self, source_path: str, target_path: str) -> bool:
         """
         Create a symbolic link from source to target
         
+        The existence check is left to the kernel: the symlink is attempted
+        unconditionally and an existing target is reported to the caller.
+        
         Args:
             source_path: Source path in /share/ directory
             target_path: Target path in project directory
             
         Returns:
-            True if symlink was created successfully, False otherwise
+            True if symlink was created successfully, False if it failed
+            
+        Raises:
+            FileExistsError: If target_path already exists
         """
         try:
-            # Ensure parent directory exists
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Create the symbolic link
-            target_path.symlink_to(source_path)
+            os.symlink(source_path, target_path)
             
-            self.logger.info(f"Created symlink: {target_path} -> {source_path}")
+            self.logger.info("Created symlink: %s -> %s", target_path, source_path)
             return True
             
+        except FileExistsError:
+            raise
         except OSError as e:
             self.logger.error(f"Failed to create symlink {target_path} -> {source_path}: {e}")
             return False
@@ -175,11 +477,12 @@ class SymlinkManager:
         removed_links = []
         
         for target_dir in self.target_directories:
-            project_path = self.project_root / target_dir
+            project_path = os.path.join(self._project_root_str, target_dir)
             
-            if project_path.is_symlink():
+            # Check the path afresh instead of trusting the cache before deleting anything
+            if os.path.islink(project_path):
                 try:
-                    project_path.unlink()
+                    os.unlink(project_path)
                     removed_links.append(target_dir)
                     self.logger.info(f"Removed symlink: {project_path}")
                 except OSError as e:
@@ -187,6 +490,8 @@ class SymlinkManager:
         
         if removed_links:
             self.logger.info(f"Removed symlinks: {', '.join(removed_links)}")
+        
+        self.invalidate()
     
     def list_symlinks(self) -> List[str]:
         """
@@ -198,21 +503,19 @@ class SymlinkManager:
         symlinks = []
         
         for target_dir in self.target_directories:
-            project_path = self.project_root / target_dir
-            
-            if project_path.is_symlink():
+            if self._is_symlink(target_dir):
                 symlinks.append(target_dir)
         
         return symlinks
     
-    def get_symlink_info(self) -> dict:
+    def get_symlink_info(self) -> Dict[str, Any]:
         """
         Get information about all symlinks
         
         Returns:
             Dictionary with symlink information
         """
-        info = {
+        info: Dict[str, Any] = {
             "project_root": str(self.project_root),
             "share_directory": str(self.share_directory),
             "symlinks": {},
@@ -221,150 +524,29 @@ class SymlinkManager:
         }
         
         for target_dir in self.target_directories:
-            share_path = self.share_directory / target_dir
-            project_path = self.project_root / target_dir
+            share_path = os.path.join(str(self.share_directory), target_dir)
+            project_path = os.path.join(self._project_root_str, target_dir)
+            
+            source = None
+            if self._is_symlink(target_dir):
+                try:
+                    source = os.readlink(project_path)
+                except OSError:
+                    # The cached lstat is stale, so classify the path again
+                    self._meta_cache.pop(target_dir, None)
             
-            if project_path.is_symlink():
+            if source is not None:
                 info["symlinks"][target_dir] = {
-                    "target": str(project_path),
-                    "source": str(project_path.resolve()),
-                    "exists": project_path.exists()
+                    "target": project_path,
+                    "source": source,
+                    "exists": os.path.exists(project_path)
                 }
-            elif project_path.exists():
-                info["existing_directories"][target_dir] = str(project_path)
+            elif self._get_lmeta(target_dir) is not None:
+                info["existing_directories"][target_dir] = project_path
             else:
-                info["missing_in_share"][target_dir] = str(share_path)
+                info["missing_in_share"][target_dir] = share_path
         
         return info
-    
-    def _create_deep_symlinks(self) -> List[str]:
-        """
-        Create symlinks for files and subdirectories within the target directories
-        This handles cases like /share/models/diffusion_models/file.safetensors
-        
-        Returns:
-            List of created deep symlinks
-        """
-        deep_links = []
-        
-        for target_dir in self.target_directories:
-            share_base = self.share_directory / target_dir
-            project_base = self.project_root / target_dir
-            
-            if not share_base.exists():
-                continue
-                
-            # If the target directory is already a symlink, skip deep linking
-            if project_base.is_symlink():
-                self.logger.debug(f"Skipping deep linking for {target_dir} (already a symlink)")
-                continue
-                
-            # If the target directory doesn't exist, create it first
-            if not project_base.exists():
-                project_base.mkdir(parents=True, exist_ok=True)
-            
-            # Recursively scan and create symlinks for files and subdirectories
-            deep_links.extend(self._scan_and_link_directory(share_base, project_base, 0))
-        
-        return deep_links
-    
-    def _create_deep_symlinks_for_existing_directory(self, share_path: Path, project_path: Path) -> List[str]:
-        """
-        Create symlinks for files and subdirectories in an existing directory
-        Only creates symlinks for items that don't already exist in the project
-        
-        Args:
-            share_path: Source directory in /share/
-            project_path: Target directory in project (already exists)
-            
-        Returns:
-            List of created symlinks
-        """
-        created_links = []
-        
-        try:
-            # Recursively scan and create symlinks for new files and subdirectories
-            created_links.extend(self._scan_and_link_directory(share_path, project_path, 0))
-        except Exception as e:
-            self.logger.error(f"Error creating deep symlinks for existing directory {project_path}: {e}")
-        
-        return created_links
-    
-    def _scan_and_link_directory(self, share_path: Path, project_path: Path, depth: int = 0) -> List[str]:
-        """
-        Recursively scan a directory and create symlinks for files and subdirectories
-        Prioritizes individual files over directory symlinks
-        
-        Args:
-            share_path: Source directory in /share/
-            project_path: Target directory in project
-            depth: Current recursion depth (0-based)
-            
-        Returns:
-            List of created symlinks
-        """
-        created_links = []
-        
-        try:
-            
-            # First, collect all items
-            items = list(share_path.iterdir())
-            
-            # Separate files and directories
-            files = [item for item in items if item.is_file()]
-            directories = [item for item in items if item.is_dir()]
-            
-            # Process files first (higher priority)
-            for file_item in files:
-                share_item = share_path / file_item.name
-                project_item = project_path / file_item.name
-                
-                # Skip if target already exists
-                if project_item.exists():
-                    self.logger.debug(f"Skipping {project_item} (already exists)")
-                    continue
-                
-                # Create symlink for the file
-                if self._create_symlink(share_item, project_item):
-                    created_links.append(str(project_item.relative_to(self.project_root)))
-                    self.logger.debug(f"Created file symlink: {project_item} -> {share_item}")
-                else:
-                    self.logger.debug(f"Failed to create symlink for {project_item}")
-            
-            # Then process directories
-            for dir_item in directories:
-                share_item = share_path / dir_item.name
-                project_item = project_path / dir_item.name
-                
-                # If target already exists, continue scanning for new files
-                if project_item.exists():
-                    self.logger.debug(f"Target {project_item} already exists, scanning for new files")
-                    # Continue scanning for new files in existing directory
-                    if share_item.is_dir():
-                        created_links.extend(self._scan_and_link_directory(share_item, project_item, depth + 1))
-                    continue
-                
-                # Check if directory has files that should be linked individually
-                has_files = any(item.is_file() for item in share_item.iterdir())
-                
-                if has_files:
-                    # Create directory and link files individually
-                    project_item.mkdir(parents=True, exist_ok=True)
-                    created_links.extend(self._scan_and_link_directory(share_item, project_item, depth + 1))
-                else:
-                    # Create directory symlink
-                    if self._create_symlink(share_item, project_item):
-                        created_links.append(str(project_item.relative_to(self.project_root)))
-                        self.logger.debug(f"Created directory symlink: {project_item} -> {share_item}")
-                    else:
-                        self.logger.debug(f"Failed to create symlink for {project_item}")
-        
-        except PermissionError as e:
-            self.logger.warning(f"Permission denied scanning {share_path}: {e}")
-        except Exception as e:
-            self.logger.error(f"Error scanning {share_path}: {e}")
-        
-        return created_links
 
 
 def setup_share_symlinks(project_root: str, share_directory: str = "/share") -> None: